@@ -5,6 +5,7 @@ for all indexes.
 """
 import hashlib
 import mimetypes
+from functools import lru_cache
 from wsgiref.handlers import format_date_time
 import re
 from devpi_common.metadata import splitbasename
@@ -15,6 +16,26 @@ from urllib.parse import unquote
 
 _nodefault = object()
 
+_dirname_rex = re.compile(r"[^a-zA-Z0-9_.-]")
+
+_hash_constructors = {}
+
+
+def _get_hasher(hash_type):
+    # resolve the constructor only once per hash type. The named
+    # constructors in hashlib are backed by OpenSSL, which picks the
+    # fastest implementation for the running CPU (e.g. SHA extensions)
+    # at runtime, so prefer those over hashlib.new.
+    try:
+        constructor = _hash_constructors[hash_type]
+    except KeyError:
+        constructor = getattr(hashlib, hash_type, None)
+        if constructor is None:
+            def constructor(hash_type=hash_type):
+                return hashlib.new(hash_type)
+        _hash_constructors[hash_type] = constructor
+    return constructor()
+
 
 def get_default_hash_algo():
     return hashlib.sha256
@@ -29,12 +50,24 @@ def get_default_hash_type():
 
 
 def get_file_hash(fp, hash_type):
-    running_hash = getattr(hashlib, hash_type)()
-    while 1:
-        data = fp.read(65536)
-        if not data:
-            break
-        running_hash.update(data)
+    running_hash = _get_hasher(hash_type)
+    readinto = getattr(fp, "readinto", None)
+    if readinto is None:
+        while 1:
+            data = fp.read(65536)
+            if not data:
+                break
+            running_hash.update(data)
+    else:
+        # read into a reusable buffer instead of allocating a fresh
+        # bytes object for every chunk
+        buf = bytearray(65536)
+        view = memoryview(buf)
+        while 1:
+            size = readinto(buf)
+            if not size:
+                break
+            running_hash.update(view[:size])
     return running_hash.hexdigest()
 
 
@@ -53,15 +86,20 @@ def get_hash_spec(content_or_file, hash_type):
                     "Read %.1f megabytes into memory in get_default_hash_spec",
                     len(content_or_file) / 1048576)
     if isinstance(content_or_file, bytes):
-        running_hash = getattr(hashlib, hash_type)(content_or_file)
+        running_hash = _get_hasher(hash_type)
+        running_hash.update(content_or_file)
         return f"{running_hash.name}={running_hash.hexdigest()}"
 
 
+# the same release file is mapped over and over during pip bulk
+# installs, so remember the computed directory split per hash spec
+@lru_cache(maxsize=4096)
 def make_splitdir(hash_spec):
-    parts = hash_spec.split("=")
-    assert len(parts) == 2
-    hash_value = parts[1]
-    return hash_value[:3], hash_value[3:16]
+    assert hash_spec.count("=") == 1
+    # slice the two prefixes directly out of the spec instead of
+    # allocating an intermediate string for the full hash value
+    start = hash_spec.index("=") + 1
+    return hash_spec[start:start + 3], hash_spec[start + 3:start + 16]
 
 
 def key_from_link(keyfs, link, user, index):
@@ -78,7 +116,7 @@ def key_from_link(keyfs, link, user, index):
         parts = link.torelpath().split("/")
         assert parts
         dirname = "_".join(parts[:-1])
-        dirname = re.sub('[^a-zA-Z0-9_.-]', '_', dirname)
+        dirname = _dirname_rex.sub('_', dirname)
         return keyfs.PYPIFILE_NOMD5(
             user=user, index=index,
             dirname=unquote(dirname),
@@ -307,8 +345,7 @@ class FileEntry(object):
 def get_checksum_error(content_or_hash, relpath, hash_spec):
     if not hash_spec:
         return
-    hash_algo, hash_value = parse_hash_spec(hash_spec)
-    hash_type = hash_spec.split("=")[0]
+    hash_type, _, hash_value = hash_spec.partition("=")
     hexdigest = getattr(content_or_hash, "hexdigest", None)
     if callable(hexdigest):
         hexdigest = hexdigest()
@@ -317,7 +354,9 @@ def get_checksum_error(content_or_hash, relpath, hash_spec):
                 f"{relpath}: hash type mismatch, "
                 f"got {content_or_hash.name}, expected {hash_type}")
     else:
-        hexdigest = hash_algo(content_or_hash).hexdigest()
+        running_hash = _get_hasher(hash_type)
+        running_hash.update(content_or_hash)
+        hexdigest = running_hash.hexdigest()
     if hexdigest != hash_value:
         return ValueError(
             f"{relpath}: {hash_type} mismatch, "
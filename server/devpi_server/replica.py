@@ -975,7 +975,7 @@ class FileReplicationThread:
                 err = None
 
                 while 1:
-                    data = r.raw.read(10240)
+                    data = r.raw.read(65536)
                     if not data:
                         break
                     filesize += len(data)
@@ -1599,7 +1599,7 @@ def iter_cache_remote_file(xom, entry, url):
             yield _headers_from_response(r)
 
             while 1:
-                data = r.raw.read(10240)
+                data = r.raw.read(65536)
                 if not data:
                     break
                 filesize += len(data)
@@ -1712,7 +1712,7 @@ def iter_remote_file_replica(xom, entry, url):
             yield _headers_from_response(r)
 
             while 1:
-                data = r.raw.read(10240)
+                data = r.raw.read(65536)
                 if not data:
                     break
                 running_hash.update(data)
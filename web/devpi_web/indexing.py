@@ -1,10 +1,18 @@
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from devpi_common.types import ensure_unicode
-from devpi_common.metadata import get_sorted_versions
+from devpi_common.metadata import Version
 from devpi_common.validation import normalize_name
 from devpi_web.config import get_pluginmanager
 from devpi_web.doczip import Docs
-import attr
+from functools import lru_cache
+from sys import intern
+
+
+# the same project names and the small set of user/index strings are
+# processed over and over during indexing, so memoize these pure helpers
+ensure_unicode = lru_cache(maxsize=65536)(ensure_unicode)
+normalize_name = lru_cache(maxsize=65536)(normalize_name)
 
 
 def is_project_cached(stage, project):
@@ -14,6 +22,21 @@ def is_project_cached(stage, project):
     return True
 
 
+def _iter_sorted_versions(versions):
+    # yield the latest version first and sort the rest lazily; most
+    # projects find their doczip (or none at all) on the latest version,
+    # so the full O(n log n) sort is often not needed
+    versions = list(map(Version, versions))
+    if not versions:
+        return
+    latest = max(range(len(versions)), key=versions.__getitem__)
+    yield versions[latest].string
+    del versions[latest]
+    versions.sort(reverse=True)
+    for version in versions:
+        yield version.string
+
+
 def preprocess_project(project):
     stage = project.stage
     pm = get_pluginmanager(stage.xom.config)
@@ -25,56 +48,65 @@ def preprocess_project(project):
         user, index = stage.name.split('/')
     user = ensure_unicode(user)
     index = ensure_unicode(index)
-    if not is_project_cached(stage, name):
+    is_mirror = stage.ixconfig['type'] == 'mirror'
+    if is_mirror and not stage.is_project_cached(name):
         result = dict(name=project.name, user=user, index=index)
         pm.hook.devpiweb_modify_preprocess_project_result(
             project=project, result=result)
         return result
     stage.offline = True
-    if not stage.has_project_perstage(name):
+    # for mirrors the cache check above already proved the project
+    # exists, has_project_perstage would repeat the same keyfs lookup
+    if not is_mirror and not stage.has_project_perstage(name):
         # project doesn't exist anymore
         return
     setuptools_metadata = frozenset(getattr(stage, 'metadata_keys', ()))
-    versions = get_sorted_versions(stage.list_versions_perstage(name))
+    versions = _iter_sorted_versions(stage.list_versions_perstage(name))
     result = dict(name=project.name)
     for i, version in enumerate(versions):
         if i == 0:
             verdata = stage.get_versiondata_perstage(project.name, version)
-            result.update(verdata)
+            # filter unknown/empty metadata values while updating
+            # instead of scanning all metadata keys again afterwards
+            result.update(
+                (key, value) for key, value in verdata.items()
+                if not (key in setuptools_metadata
+                        and (not value or value == 'UNKNOWN')))
         links = stage.get_linkstore_perstage(name, version).get_links(rel="doczip")
         if links:
-            docs = Docs(stage, project.name, version)
-            if docs.exists():
+            # check the already fetched link before instantiating Docs,
+            # which would repeat the linkstore lookup just done above
+            if links[0].entry.file_exists():
                 result['doc_version'] = version
-                result['+doczip'] = docs
+                result['+doczip'] = Docs(stage, project.name, version)
             break
         else:
             assert '+doczip' not in result
 
     result[u'user'] = user
     result[u'index'] = index
-    for key in setuptools_metadata:
-        if key in result:
-            value = result[key]
-            if value == 'UNKNOWN' or not value:
-                del result[key]
     pm.hook.devpiweb_modify_preprocess_project_result(
         project=project, result=result)
     return result
 
 
-@attr.s(slots=True)
 class ProjectIndexingInfo(object):
-    stage = attr.ib()
-    name = attr.ib(type=str)
+    # instantiated once per project during indexing, so keep it a plain
+    # __slots__ class instead of attrs to make construction as cheap
+    # as possible
+    __slots__ = ('stage', 'name', 'indexname', 'is_from_mirror')
 
-    @property
-    def indexname(self):
-        return self.stage.name
+    def __init__(self, stage, name):
+        self.stage = stage
+        self.name = name
+        # the index name and type don't change while this object is
+        # alive, resolve them once instead of on every access
+        self.indexname = stage.name
+        self.is_from_mirror = stage.ixconfig['type'] == 'mirror'
 
-    @property
-    def is_from_mirror(self):
-        return self.stage.ixconfig['type'] == 'mirror'
+    def __repr__(self):
+        return "%s(stage=%r, name=%r)" % (
+            self.__class__.__name__, self.stage, self.name)
 
 
 def iter_indexes(xom):
@@ -91,18 +123,45 @@ def iter_indexes(xom):
     yield from mirrors
 
 
-def iter_projects(xom):
-    for username, index in iter_indexes(xom):
+def _list_projects(xom, username, index):
+    # runs in a prefetch thread with its own read transaction
+    with xom.keyfs.transaction(write=False):
         stage = xom.model.getstage(username, index)
         if stage is None:  # this is async, so the stage may be gone
-            continue
+            return None
         names = stage.list_projects_perstage()
         if isinstance(names, Mapping):
             # since devpi-server 6.6.0 mirrors return a mapping where
             # the un-normalized names are in the values
             names = names.values()
-        for name in names:
-            name = ensure_unicode(name)
-            yield ProjectIndexingInfo(
-                stage=stage,
-                name=name)
+        return list(names)
+
+
+def iter_projects(xom):
+    indexes = list(iter_indexes(xom))
+    if not indexes:
+        return
+    # fetch the project names of the next index in a background thread,
+    # so the keyfs reads (or the remote name list update for mirrors)
+    # overlap with the consumer processing the current index
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(_list_projects, xom, *indexes[0])
+        for position, (username, index) in enumerate(indexes, start=1):
+            names = future.result()
+            if position < len(indexes):
+                future = executor.submit(
+                    _list_projects, xom, *indexes[position])
+            if names is None:
+                continue
+            stage = xom.model.getstage(username, index)
+            if stage is None:  # this is async, so the stage may be gone
+                continue
+            for name in names:
+                # keyfs deserializes fresh name strings on every run
+                # for private stages; interning keeps a single copy
+                # shared with the search index and previous reindex
+                # runs.
+                # positional call, a keyword call allocates an extra
+                # dict for every yielded project
+                yield ProjectIndexingInfo(
+                    stage, intern(ensure_unicode(name)))
@@ -1,6 +1,8 @@
 from devpi_common.archive import zip_dict
+from devpi_common.metadata import get_sorted_versions
 from devpi_common.metadata import parse_version
 from devpi_web.indexing import ProjectIndexingInfo
+from devpi_web.indexing import _iter_sorted_versions
 from devpi_web.indexing import iter_projects
 from devpi_web.indexing import preprocess_project
 from devpi_server import __version__ as _devpi_server_version
@@ -91,3 +93,9 @@ def test_empty_doczip(mapp, testapp):
         remove_docs(stage, name, version)
     # the hash file should be removed
     assert not path.new(ext="hash").exists()
+
+
+def test_iter_sorted_versions():
+    versions = ["1.0", "2.0.dev1", "1.1", "10.0", "2.0", "1.0rc1"]
+    assert list(_iter_sorted_versions(versions)) == get_sorted_versions(versions)
+    assert list(_iter_sorted_versions([])) == []